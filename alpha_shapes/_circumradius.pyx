@@ -0,0 +1,38 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled kernel for the squared circumradii of the triangles.
+
+The extension is optional. If it is not built, the numba or numpy
+implementations are used instead.
+"""
+
+
+cdef extern from "_circumradius_simd.h" nogil:
+    void circumradii_sq_simd(const double *tri_xy, Py_ssize_t n, double *out)
+
+
+def circumradii_sq(const double[:, :, ::1] tri_xy, double[::1] out):
+    """
+    Calculate the squared circumradii of triangles and write them into `out`.
+
+    The vectorized AVX2 code path is used if the CPU supports it.
+    The GIL is released during the calculation.
+    See `alpha_shapes.alpha_shapes._circumradii_sq_from_coords`
+    for the formula.
+
+    Parameters:
+    -----------
+    tri_xy: array, shape(T, 3, 2)
+        coordinates of the vertices of the triangles
+
+    out: array, shape(T,)
+        the squared circumradii, `inf` for degenerate triangles
+    """
+    if tri_xy.shape[0] == 0:
+        return
+
+    if out.shape[0] != tri_xy.shape[0]:
+        raise ValueError("out must have one element per triangle")
+
+    with nogil:
+        circumradii_sq_simd(&tri_xy[0, 0, 0], tri_xy.shape[0], &out[0])
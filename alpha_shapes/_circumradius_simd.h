@@ -0,0 +1,110 @@
+/*
+ * Squared circumradii of triangles, see
+ * `alpha_shapes.alpha_shapes._circumradii_sq_from_coords` for the formula.
+ *
+ * The coordinates are read from a C contiguous (T, 3, 2) buffer.
+ * On x86 CPUs supporting AVX2, four triangles are processed per iteration.
+ * The instruction set is selected at runtime, so the extension is built
+ * without any architecture specific compiler flags.
+ * FMA is not used on purpose: the vector lanes round exactly like the scalar
+ * loop, so that e.g. exactly collinear triangles get an infinite circumradius
+ * wherever they are in the buffer.
+ */
+#ifndef ALPHA_SHAPES_CIRCUMRADIUS_SIMD_H
+#define ALPHA_SHAPES_CIRCUMRADIUS_SIMD_H
+
+#include <math.h>
+#include <stddef.h>
+
+#if defined(__GNUC__) && (defined(__x86_64__) || defined(__i386__))
+#define ALPHA_SHAPES_HAVE_AVX2_DISPATCH 1
+#include <immintrin.h>
+#endif
+
+static void
+circumradii_sq_scalar(const double *tri_xy, ptrdiff_t start, ptrdiff_t n,
+                      double *out)
+{
+    for (ptrdiff_t i = start; i < n; i++) {
+        const double *t = tri_xy + 6 * i;
+        double ax = t[2] - t[0];
+        double ay = t[3] - t[1];
+        double bx = t[4] - t[0];
+        double by = t[5] - t[1];
+        double cx = t[4] - t[2];
+        double cy = t[5] - t[3];
+
+        double d = ax * by - bx * ay;
+        double denom = 4.0 * d * d;
+
+        if (denom == 0.0) {
+            out[i] = INFINITY;
+        }
+        else {
+            out[i] = (ax * ax + ay * ay) * (bx * bx + by * by)
+                     * (cx * cx + cy * cy) / denom;
+        }
+    }
+}
+
+#ifdef ALPHA_SHAPES_HAVE_AVX2_DISPATCH
+__attribute__((target("avx2"))) static void
+circumradii_sq_avx2(const double *tri_xy, ptrdiff_t n, double *out)
+{
+    /* offsets of the first coordinate of four consecutive triangles */
+    const __m256i stride = _mm256_set_epi64x(18, 12, 6, 0);
+    const __m256d four = _mm256_set1_pd(4.0);
+    const __m256d zero = _mm256_setzero_pd();
+    const __m256d inf = _mm256_set1_pd(INFINITY);
+
+    ptrdiff_t i = 0;
+    for (; i + 4 <= n; i += 4) {
+        const double *t = tri_xy + 6 * i;
+        __m256d x0 = _mm256_i64gather_pd(t + 0, stride, 8);
+        __m256d y0 = _mm256_i64gather_pd(t + 1, stride, 8);
+        __m256d x1 = _mm256_i64gather_pd(t + 2, stride, 8);
+        __m256d y1 = _mm256_i64gather_pd(t + 3, stride, 8);
+        __m256d x2 = _mm256_i64gather_pd(t + 4, stride, 8);
+        __m256d y2 = _mm256_i64gather_pd(t + 5, stride, 8);
+
+        __m256d ax = _mm256_sub_pd(x1, x0);
+        __m256d ay = _mm256_sub_pd(y1, y0);
+        __m256d bx = _mm256_sub_pd(x2, x0);
+        __m256d by = _mm256_sub_pd(y2, y0);
+        __m256d cx = _mm256_sub_pd(x2, x1);
+        __m256d cy = _mm256_sub_pd(y2, y1);
+
+        __m256d d = _mm256_sub_pd(_mm256_mul_pd(ax, by),
+                                  _mm256_mul_pd(bx, ay));
+        __m256d denom = _mm256_mul_pd(four, _mm256_mul_pd(d, d));
+
+        __m256d a2 = _mm256_add_pd(_mm256_mul_pd(ax, ax),
+                                   _mm256_mul_pd(ay, ay));
+        __m256d b2 = _mm256_add_pd(_mm256_mul_pd(bx, bx),
+                                   _mm256_mul_pd(by, by));
+        __m256d c2 = _mm256_add_pd(_mm256_mul_pd(cx, cx),
+                                   _mm256_mul_pd(cy, cy));
+        __m256d num = _mm256_mul_pd(_mm256_mul_pd(a2, b2), c2);
+
+        __m256d r2 = _mm256_div_pd(num, denom);
+        __m256d degenerate = _mm256_cmp_pd(denom, zero, _CMP_EQ_OQ);
+        _mm256_storeu_pd(out + i, _mm256_blendv_pd(r2, inf, degenerate));
+    }
+
+    circumradii_sq_scalar(tri_xy, i, n, out);
+}
+#endif
+
+static void
+circumradii_sq_simd(const double *tri_xy, ptrdiff_t n, double *out)
+{
+#ifdef ALPHA_SHAPES_HAVE_AVX2_DISPATCH
+    if (__builtin_cpu_supports("avx2")) {
+        circumradii_sq_avx2(tri_xy, n, out);
+        return;
+    }
+#endif
+    circumradii_sq_scalar(tri_xy, 0, n, out);
+}
+
+#endif /* ALPHA_SHAPES_CIRCUMRADIUS_SIMD_H */
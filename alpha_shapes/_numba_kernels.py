@@ -0,0 +1,125 @@
+"""
+Numba compiled kernels for the hot loops of the alpha shape calculation.
+
+Numba is an optional dependency. Importing this module raises `ImportError`
+if it is not installed, in which case the pure numpy implementations are used.
+
+Note that importing this module selects numba's "workqueue" threading layer,
+unless a layer has been chosen already, e.g. with `NUMBA_THREADING_LAYER`.
+Numba has a single threading layer per process, so this choice also applies
+to the parallel numba code of other packages.
+"""
+
+import os
+
+import numpy as np
+from numba import njit, prange  # pyright: ignore[reportMissingImports]
+from numba.core import config  # pyright: ignore[reportMissingImports]
+from numpy.typing import NDArray
+
+# The workqueue threading layer starts faster than TBB or OpenMP on the
+# first parallel call. Only chosen if the user has not picked a layer.
+# The config attributes are set at runtime, so pyright does not know them.
+if (
+    "NUMBA_THREADING_LAYER" not in os.environ
+    and config.THREADING_LAYER == "default"  # pyright: ignore[reportAttributeAccessIssue]
+):
+    config.THREADING_LAYER = "workqueue"  # pyright: ignore[reportAttributeAccessIssue]
+
+# Fast math flags, except for `nnan` and `ninf`:
+# degenerate triangles are flagged with an infinite circumradius.
+# `contract` and `reassoc` are left out too, since fusing `ax * by - bx * ay`
+# into an FMA makes the determinant of exactly collinear triangles nonzero.
+_FASTMATH = {"nsz", "arcp", "afn"}
+
+
+# The kernels are compiled eagerly for their signatures at import,
+# so that the compiled code is loaded from the on-disk cache
+# and the first call does not pay for the type inference.
+
+
+@njit(
+    "void(float64[:, :, ::1], float64[::1])",
+    parallel=True,
+    fastmath=_FASTMATH,
+    cache=True,
+    boundscheck=False,
+)
+def circumradii_sq(tri_xy: NDArray, out: NDArray):
+    """
+    Calculate the squared circumradii of triangles,
+    in a single fused pass over the triangles.
+
+    See `alpha_shapes.alpha_shapes._circumradii_sq_from_coords`
+    for the formula.
+
+    Parameters:
+    -----------
+    tri_xy: array, shape(T, 3, 2)
+        C-contiguous coordinates of the vertices of the triangles
+
+    out: array, shape(T,)
+        output array for the squared circumradii,
+        `inf` for degenerate triangles
+    """
+    n_triangles = tri_xy.shape[0]
+
+    for i in prange(n_triangles):
+        x0, y0 = tri_xy[i, 0, 0], tri_xy[i, 0, 1]
+        x1, y1 = tri_xy[i, 1, 0], tri_xy[i, 1, 1]
+        x2, y2 = tri_xy[i, 2, 0], tri_xy[i, 2, 1]
+
+        ax = x1 - x0
+        ay = y1 - y0
+        bx = x2 - x0
+        by = y2 - y0
+        cx = x2 - x1
+        cy = y2 - y1
+
+        d = ax * by - bx * ay
+
+        denom = 4.0 * d * d
+        if denom == 0.0:
+            out[i] = np.inf
+        else:
+            num = (ax * ax + ay * ay) * (bx * bx + by * by) * (cx * cx + cy * cy)
+            out[i] = num / denom
+
+
+# No fast math, which would allow to multiply by the reciprocal of the scale.
+# The normalized points must be identical to the ones of numpy,
+# or the triangulation would depend on whether numba is installed.
+@njit(
+    "Tuple((float64[:, ::1], float64[::1], float64[::1]))(float64[:, :])",
+    cache=True,
+    boundscheck=False,
+)
+def normalize_points(points: NDArray):
+    """
+    Normalize points to the unit square, centered at the origin.
+
+    See `alpha_shapes.alpha_shapes._normalize_points`.
+    The bounding box is found in a single pass over the points,
+    and the normalized points are written in a second one.
+    """
+    n_points, n_dims = points.shape
+
+    lo = points[0].copy()
+    hi = points[0].copy()
+    for i in range(1, n_points):
+        for j in range(n_dims):
+            v = points[i, j]
+            if v < lo[j]:
+                lo[j] = v
+            elif v > hi[j]:
+                hi[j] = v
+
+    center = 0.5 * (lo + hi)
+    scale = hi - lo
+
+    out = np.empty_like(points)
+    for i in range(n_points):
+        for j in range(n_dims):
+            out[i, j] = (points[i, j] - center[j]) / scale[j]
+
+    return out, center, scale
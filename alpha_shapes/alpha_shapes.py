@@ -2,13 +2,41 @@
 Utility module for the calculation of alpha shapes
 """
 
-from typing import Tuple
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Optional, Tuple
 
 import numpy as np
+import shapely
 from matplotlib.tri import Triangulation
 from numpy.typing import ArrayLike, NDArray
-from shapely.geometry import Polygon
-from shapely.ops import unary_union
+
+try:
+    from ._circumradius import (  # pyright: ignore[reportMissingImports]
+        circumradii_sq as _circumradii_sq_compiled,
+    )
+except ImportError:
+    _circumradii_sq_compiled = None
+
+# The numba kernels are a fallback for the compiled kernel. Numba is not
+# imported, and its kernels are not compiled, if the latter is available.
+if _circumradii_sq_compiled is None:
+    try:
+        from ._numba_kernels import circumradii_sq as _circumradii_sq_numba
+        from ._numba_kernels import normalize_points as _normalize_points_numba
+    except ImportError:
+        _circumradii_sq_numba = None
+        _normalize_points_numba = None
+else:
+    _circumradii_sq_numba = None
+    _normalize_points_numba = None
+
+# Number of triangles from which on the circumradii are calculated
+# in parallel threads, when numba is not used.
+PARALLEL_MIN_TRIANGLES = 5000
 
 
 class AlphaException(Exception):
@@ -33,9 +61,9 @@ class Delaunay(Triangulation):
     Mimics scipy.spatial.Delaunay interface.
     """
 
-    def __init__(self, coords: NDArray):
+    def __init__(self, coords: NDArray, triangles: Optional[NDArray] = None):
         try:
-            super().__init__(x=coords[:, 0], y=coords[:, 1])
+            super().__init__(x=coords[:, 0], y=coords[:, 1], triangles=triangles)
         except ValueError as e:
             if "at least 3" in str(e):
                 raise NotEnoughPoints("Need at least 3 points")
@@ -51,87 +79,269 @@ class Delaunay(Triangulation):
 
 
 class Alpha_Shaper(Delaunay):
-    mask: NDArray  # for type hinting
-
-    def __init__(self, points: ArrayLike, normalize=True):
+    # The mask of the triangulation, for type hinting. It is None until
+    # a mask is set, e.g. by `set_mask_at_alpha` or `optimize`.
+    mask: Optional[NDArray]
+
+    # triangles of recent `from_points` calls, keyed by a digest of the points
+    _triangles_cache: "OrderedDict[tuple, NDArray]" = OrderedDict()
+    TRIANGLES_CACHE_SIZE = 8
+
+    def __init__(
+        self,
+        points: ArrayLike,
+        normalize=True,
+        triangulation: Optional[Triangulation] = None,
+    ):
+        """
+        Parameters:
+        -----------
+        points: array-like, shape(N,2)
+            coordinates of the points
+
+        normalize: bool
+            whether to normalize the points to the unit square
+            before the triangulation
+
+        triangulation: matplotlib.tri.Triangulation, optional
+            a precomputed triangulation of the points, whose triangles are
+            used as is instead of triangulating the points again
+        """
         self.normalized = normalize
 
-        points = np.array(points)
+        points = np.asarray(points, dtype=np.float64)
+        triangles = None if triangulation is None else triangulation.triangles
 
         if self.normalized:
+            # normalization already works on a copy of the points
             points, center, scale = _normalize_points(points)
-            self._initialize(points)
+            self._initialize(points, triangles)
             self._denormalize(center, scale)
 
         else:
-            self._initialize(points)
+            self._initialize(points.copy(), triangles)
+
+    @classmethod
+    def from_points(cls, points: ArrayLike, normalize=True) -> "Alpha_Shaper":
+        """
+        Create an alpha shaper, reusing the triangulation of a recent call
+        with the same points and normalization, if there is one.
+        """
+        points = np.ascontiguousarray(points, dtype=np.float64)
+        digest = hashlib.blake2b(points.tobytes(), digest_size=16).digest()
+        key = (digest, points.shape, normalize)
+
+        triangles = cls._triangles_cache.get(key)
+        if triangles is not None:
+            cls._triangles_cache.move_to_end(key)
+            return cls.from_triangulation(points, triangles, normalize=normalize)
+
+        shaper = cls(points, normalize=normalize)
+        cls._triangles_cache[key] = shaper.triangles
+        if len(cls._triangles_cache) > cls.TRIANGLES_CACHE_SIZE:
+            cls._triangles_cache.popitem(last=False)
+
+        return shaper
+
+    @classmethod
+    def from_triangulation(
+        cls, points: ArrayLike, simplices: ArrayLike, normalize=True
+    ) -> "Alpha_Shaper":
+        """
+        Create an alpha shaper from precomputed simplices of the points,
+        e.g. the `simplices` of a `scipy.spatial.Delaunay`,
+        instead of triangulating the points again.
+
+        Parameters:
+        -----------
+        points: array-like, shape(N,2)
+            coordinates of the points
+
+        simplices: array-like of int, shape(T,3)
+            indices of the vertices of each triangle
+
+        normalize: bool
+            whether to normalize the points to the unit square.
+            The normalization scales each axis separately, so the Delaunay
+            triangulation of the normalized points may differ from
+            the triangulation of the original points.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        triangulation = Triangulation(points[:, 0], points[:, 1], simplices)
+        return cls(points, normalize=normalize, triangulation=triangulation)
 
-    def _initialize(self, points: NDArray):
+    def _initialize(self, points: NDArray, triangles: Optional[NDArray] = None):
         """
         _initialize the alpha shaper.
         """
-        super().__init__(points)
+        super().__init__(points, triangles)
+
+        self._update_triangle_coords()
+        circumradii_sq = self._calculate_cirumradii_sq_of_internal_triangles()
+        if self.normalized:
+            # Normalized circumradii are compared against the threshold with
+            # plenty of margin in single precision, which halves the memory
+            # traffic of the sort and of the masks.
+            # Degenerate triangles may overflow to `inf`, as they should.
+            with np.errstate(over="ignore"):
+                circumradii_sq = circumradii_sq.astype(np.float32)
+        self.circumradii_sq = circumradii_sq
+        self._mask_buffer = np.empty(len(self), dtype=bool)
+        self._mask_alpha: Optional[float] = None
+
+    @cached_property
+    def argsort(self) -> NDArray:
+        """
+        The indices that sort the triangles by circumradius.
+        Calculated on first use.
+        """
+        return np.argsort(self.circumradii_sq)
 
-        self.circumradii_sq = self._calculate_cirumradii_sq_of_internal_triangles()
-        self.argsort = np.argsort(self.circumradii_sq)
-        default_mask = np.full_like(self.circumradii_sq, False, dtype=bool)
-        self.set_mask(default_mask)
+    @cached_property
+    def _sorted_simplices_cache(self) -> NDArray:
+        return self.simplices[self.argsort]
+
+    @cached_property
+    def _sorted_circumradii_cache(self) -> NDArray:
+        return self.circumradii_sq[self.argsort]
 
     def _denormalize(self, center, scale):
-        self.x = self.x * scale[0] + center[0]
-        self.y = self.y * scale[1] + center[1]
+        """
+        Map the normalized coordinates back to the original ones, in place.
+        The triangle coordinate buffer is transformed directly instead of
+        being gathered again.
+        """
+        self.x *= scale[0]
+        self.x += center[0]
+        self.y *= scale[1]
+        self.y += center[1]
+
+        self._tri_xy *= scale
+        self._tri_xy += center
+        self._clear_triangle_caches()
+
+    def _update_triangle_coords(self):
+        """
+        Gather the vertex coordinates of all triangles in a contiguous
+        buffer of shape (T, 3, 2), so that the per triangle calculations
+        read them with a single stride-1 sweep.
+        """
+        tri_xy = np.empty((len(self), 3, 2))
+        tri_xy[:, :, 0] = self.x[self.simplices]
+        tri_xy[:, :, 1] = self.y[self.simplices]
+        self._tri_xy = tri_xy
+        self._clear_triangle_caches()
+
+    def _clear_triangle_caches(self):
+        """
+        Drop the cached polygons, after the triangle coordinates change.
+        """
+        self.__dict__.pop("_triangles", None)
+        self.__dict__.pop("_sorted_triangles", None)
+
+    @cached_property
+    def _triangles(self) -> NDArray:
+        """
+        The polygons of all triangles, constructed on first use and
+        reused by every subsequent shape.
+        """
+        return np.asarray(shapely.polygons(self._tri_xy))
+
+    @cached_property
+    def _sorted_triangles(self) -> NDArray:
+        return self._triangles[self.argsort]
 
     def _calculate_cirumradii_sq_of_internal_triangles(self):
-        circumradii_sq = [
-            self._get_circumradius_sq_of_internal_simplex(smpl)
-            for smpl in self.simplices
-        ]
-        return np.array(circumradii_sq)
+        circumradii_sq = np.empty(len(self))
+
+        if _circumradii_sq_compiled is not None:
+            kernel = _circumradii_sq_compiled
+        elif _circumradii_sq_numba is not None:
+            # the numba kernel is parallelized by itself
+            _circumradii_sq_numba(self._tri_xy, circumradii_sq)
+            return circumradii_sq
+        else:
+            kernel = _circumradii_sq_numpy
 
-    def _get_circumradius_sq_of_internal_simplex(self, smpl):
-        x = self.x[smpl]
-        y = self.y[smpl]
-        return _calculate_cirumradius_sq_of_triangle(x, y)
+        _run_on_triangle_chunks(kernel, self._tri_xy, circumradii_sq)
+        return circumradii_sq
 
     def _sorted_simplices(self):
-        return self.simplices[self.argsort]
+        return self._sorted_simplices_cache
 
-    def _sorted_circumradii_sw(self) -> NDArray[np.float64]:
-        return self.circumradii_sq[self.argsort]
+    def _sorted_circumradii_sw(self) -> NDArray[np.floating]:
+        return self._sorted_circumradii_cache
+
+    def _shape_from_triangles(self, triangles):
+        """
+        return the union of the specified triangle polygons
+        """
+        # Triangles that are not degenerate in the normalized coordinates
+        # may still be collinear in the original ones. They do not add
+        # to the shape, but break the coverage.
+        triangles = triangles[shapely.area(triangles) > 0]
+
+        # The Delaunay triangles form a polygonal coverage,
+        # so they can be dissolved along their shared edges,
+        # without the overhead of a full overlay.
+        try:
+            return shapely.coverage_union_all(triangles)
+        except shapely.errors.GEOSException:
+            # the triangles are not correctly noded after all
+            return shapely.unary_union(triangles)
 
-    def _shape_from_simplices(self, simplices):
-        triangles = [_simplex_to_triangle(smpl, self) for smpl in simplices]
+    def _circumradius_sq_threshold(self, alpha):
+        """
+        The squared circumradius above which triangles are excluded
+        from the alpha shape at `alpha`,
+        in the precision of the stored circumradii.
+        """
+        finfo = np.finfo(self.circumradii_sq.dtype)
+        threshold = min(1.0 / (alpha * alpha), float(finfo.max))
+        return finfo.dtype.type(threshold)
+
+    def get_mask(self, alpha, out=None):
+        """
+        Return the mask of the triangles excluded from the alpha shape
+        at the specified alpha value.
+        If given, the mask is written into the boolean array `out`.
+        """
+        threshold = self._circumradius_sq_threshold(alpha)
+        return np.greater(self.circumradii_sq, threshold, out=out)
 
-        return unary_union(triangles)
+    def _count_at_alpha(self, alpha) -> int:
+        """
+        Return the number of triangles in the alpha shape at `alpha`.
+        The triangles of the shape are the first ones in order of circumradius.
+        """
+        if alpha <= 0:
+            return len(self)
 
-    def get_mask(self, alpha):
-        return self.circumradii_sq > 1 / alpha**2
+        threshold = self._circumradius_sq_threshold(alpha)
+        sorted_circumradii_sq = self._sorted_circumradii_sw()
+        return int(np.searchsorted(sorted_circumradii_sq, threshold, side="right"))
 
     def get_shape(self, alpha):
-        if alpha > 0:
-            select = self.circumradii_sq <= 1 / alpha**2
-            simplices = self.simplices[select]
-        else:
-            simplices = self.simplices
+        return self._nth_shape(self._count_at_alpha(alpha))
 
-        return self._shape_from_simplices(simplices)
+    def sweep_alphas(self, alphas: ArrayLike):
+        """
+        Return the alpha shapes at each of the specified alpha values.
+        The triangles are sorted only once for all of them.
+        """
+        return [self.get_shape(alpha) for alpha in np.ravel(alphas)]
 
     def _nth_shape(self, n):
         """
         return the shape formed by the n smallest simplices
         """
-        simplices = self._sorted_simplices()[:n]
-        return self._shape_from_simplices(simplices)
+        return self._shape_from_triangles(self._sorted_triangles[:n])
 
-    def all_vertices(self):
-        return set(np.ravel(self.simplices))
-
-    def _uncovered_vertices(self, simplices):
+    def all_vertices(self) -> NDArray:
         """
-        Return a set of vertices that is not covered by the
-        specified simplices.
+        Return the sorted indices of the vertices of the triangulation.
         """
-        return self.all_vertices() - set(np.ravel(simplices))
+        return np.unique(self.simplices.ravel())
 
     def _get_minimum_fully_covering_index_of_simplices(self) -> int:
         """
@@ -141,35 +351,45 @@ class Alpha_Shaper(Delaunay):
         # At least N//3 triangles are needed to connect N points.
         simplices = self._sorted_simplices()
         n_start = len(self) // 3
-        n_finish = len(self)
-        uncovered_vertices = self._uncovered_vertices(simplices[:n_start])
-        if not uncovered_vertices:
-            return n_start
 
-        for n in range(n_start, n_finish):
-            simplex = simplices[n]
-            uncovered_vertices -= set(simplex)
+        # flat position at which each vertex appears for the first time
+        flat = simplices.ravel()
+        first_seen = np.full(self.x.size, flat.size, dtype=np.intp)
+        np.minimum.at(first_seen, flat, np.arange(flat.size))
 
-            if not uncovered_vertices:
-                return n
+        # vertices missing from the triangulation are never covered
+        first_seen = first_seen[first_seen < flat.size]
+        if first_seen.size == 0:
+            raise OptimizationFailure("Maybe there are duplicate points?")
 
-        raise OptimizationFailure("Maybe there are duplicate points?")
+        return max(n_start, int(first_seen.max()) // 3)
 
     def optimize(self):
         # At least N//3 triangles are needed to connect N points.
         n_min = self._get_minimum_fully_covering_index_of_simplices()
-        alpha_opt = 1 / np.sqrt(self._sorted_circumradii_sw()[n_min]) - 1e-10
-        simplices = self._sorted_simplices()
-        shape = self._shape_from_simplices(simplices[: n_min + 1])
+        circumradius_sq = float(self._sorted_circumradii_sw()[n_min])
+        alpha_opt = 1 / np.sqrt(circumradius_sq) - 1e-10
+        shape = self._nth_shape(n_min + 1)
         self.set_mask_at_alpha(alpha_opt)
         return alpha_opt, shape
 
     def set_mask_at_alpha(self, alpha: float):
         """
         Set the mask for the alpha shape at the specified alpha value.
+
+        The mask is written into the same array on every call,
+        so a `mask` kept from an earlier call changes too.
+        Use `mask.copy()` to keep the mask at a given alpha value.
         """
-        mask = self.get_mask(alpha)
+        if alpha == self._mask_alpha and self.mask is self._mask_buffer:
+            # the mask is already set at this alpha value
+            return self
+
+        # The mask is written into the same buffer on every call.
+        # `set_mask` keeps a reference to it, so it must be called every time.
+        mask = self.get_mask(alpha, out=self._mask_buffer)
         self.set_mask(mask)
+        self._mask_alpha = alpha
         return self
 
 
@@ -177,6 +397,10 @@ def _normalize_points(points: NDArray) -> Tuple[NDArray, NDArray, NDArray]:
     """
     Normalize points to the unit square, centered at the origin.
 
+    The points are centered on the middle of their bounding box. In exact
+    arithmetic the triangulation does not depend on the center, but in
+    floating point nearly cocircular points may be triangulated differently.
+
     Parameters:
     -----------
     points: array-like, shape(N,2)
@@ -188,56 +412,139 @@ def _normalize_points(points: NDArray) -> Tuple[NDArray, NDArray, NDArray]:
         normalized coordinates of the points
 
     center: array, shape(2,)
-        coordinates of the center of the points
+        coordinates of the center of the bounding box of the points
 
     scale: array, shape(2,)
         scale factors for the normalization
     """
-    center = points.mean(axis=0)
-    scale = np.ptp(points, axis=0)  # peak to peak distance
-    normalized_points = (points - center) / scale
+    if _normalize_points_numba is not None and points.size:
+        return _normalize_points_numba(points)
+
+    lo = points.min(axis=0)
+    hi = points.max(axis=0)
+    center = 0.5 * (lo + hi)  # center of the bounding box
+    scale = hi - lo  # peak to peak distance
+
+    normalized_points = points - center
+    normalized_points /= scale
 
     return normalized_points, center, scale
 
 
-def _circumradius_sq(lengths):
-    r"""
-    Calculate the squared circumradius `r_c^2`,
-    where
-    r_c = \frac {abc}{4{\sqrt {s(s-a)(s-b)(s-c)}}}
-    See: `https://en.wikipedia.org/wiki/Circumscribed_circle`
+def _run_on_triangle_chunks(kernel, tri_xy: NDArray, out: NDArray):
     """
-    lengths = np.asarray(lengths)
-    s = np.sum(lengths) / 2
+    Run `kernel(tri_xy, out)` on chunks of the triangles in parallel threads.
 
-    num = np.prod(lengths) ** 2
+    The kernels spend their time in code that releases the GIL,
+    so the threads run concurrently. Small inputs are processed
+    in the calling thread, to avoid the overhead of the thread pool.
+    """
+    n_triangles = tri_xy.shape[0]
+    n_workers = min(os.cpu_count() or 1, n_triangles // PARALLEL_MIN_TRIANGLES)
+
+    if n_workers <= 1:
+        kernel(tri_xy, out)
+        return
+
+    bounds = np.linspace(0, n_triangles, n_workers + 1).astype(int)
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = [
+            executor.submit(kernel, tri_xy[start:stop], out[start:stop])
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        for future in futures:
+            future.result()
 
-    denom = 16 * s * np.prod(s - lengths)
 
-    try:
-        return num / denom
-    except ZeroDivisionError:
-        return np.inf
+def _circumradii_sq_numpy(tri_xy: NDArray, out: NDArray):
+    """
+    Write the squared circumradii of the triangles `tri_xy` into `out`.
+    """
+    out[:] = _circumradii_sq_from_coords(tri_xy[..., 0], tri_xy[..., 1])
 
 
-def _calculate_cirumradius_sq_of_triangle(x: ArrayLike, y: ArrayLike):
-    """
-    calculates the squared circumradius of a triangle with coordinates x, y
+def _circumradii_sq_from_coords(xs: ArrayLike, ys: ArrayLike) -> NDArray:
+    r"""
+    Calculate the squared circumradii `r_c^2` of triangles directly from
+    the coordinates of their vertices,
+    where
+    r_c^2 = \frac {a^2 b^2 c^2}{4 D^2}
+    and `D` is twice the signed area of the triangle.
+    No square roots are needed and, contrary to Heron's formula,
+    the result is well conditioned for thin triangles.
+    See: `https://en.wikipedia.org/wiki/Circumscribed_circle`
+
+    The bulk of the calculation is carried out in single precision.
+    Triangles for which single precision is not sufficient are
+    recalculated in double precision.
 
     Parameters:
     -----------
-    x, y: array-like, shape(3,)
-        coordinates of the triangle
+    xs, ys: array-like, shape(..., 3)
+        coordinates of the triangles, the vertices along the last axis
+
+    Returns:
+    --------
+    array, shape(...)
+        the squared circumradii, `inf` for degenerate triangles
     """
-    dx = x - np.roll(x, shift=-1)
-    dy = y - np.roll(y, shift=-1)
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+
+    circumradii_sq, inaccurate = _circumradii_sq_in_precision(xs, ys, np.float32)
+    if np.any(inaccurate):
+        circumradii_sq[inaccurate], _ = _circumradii_sq_in_precision(
+            xs[inaccurate], ys[inaccurate], np.float64
+        )
+
+    return circumradii_sq
 
-    lengths = np.hypot(dx, dy)
-    return _circumradius_sq(lengths)
 
+def _circumradii_sq_in_precision(
+    xs: NDArray, ys: NDArray, dtype
+) -> Tuple[NDArray, NDArray]:
+    """
+    Calculate the squared circumradii of triangles in the precision of `dtype`.
 
-def _simplex_to_triangle(smpl, tri):
-    x = tri.x[smpl]
-    y = tri.y[smpl]
+    The edge vectors are always taken in double precision, so that
+    coordinates with a large offset do not lose accuracy.
 
-    return Polygon(zip(x, y))
+    Returns:
+    --------
+    circumradii_sq: array of float64, shape(...)
+        the squared circumradii, `inf` for degenerate triangles
+
+    inaccurate: array of bool, shape(...)
+        flags the triangles for which the precision of `dtype` may not be
+        sufficient, that is thin, nearly degenerate or overflowing triangles
+    """
+    # overflowing triangles are flagged as inaccurate below
+    with np.errstate(over="ignore", invalid="ignore"):
+        ax = (xs[..., 1] - xs[..., 0]).astype(dtype)
+        ay = (ys[..., 1] - ys[..., 0]).astype(dtype)
+        bx = (xs[..., 2] - xs[..., 0]).astype(dtype)
+        by = (ys[..., 2] - ys[..., 0]).astype(dtype)
+        # not `bx - ax`, which cancels when the vertices 1 and 2 are close
+        cx = (xs[..., 2] - xs[..., 1]).astype(dtype)
+        cy = (ys[..., 2] - ys[..., 1]).astype(dtype)
+
+        p = ax * by
+        q = bx * ay
+        d = p - q
+
+        num = (ax * ax + ay * ay) * (bx * bx + by * by) * (cx * cx + cy * cy)
+        denom = 4 * d * d
+
+        # straight-line masked division instead of branching on degenerate triangles
+        tiny = np.finfo(dtype).tiny
+        degenerate = denom == 0
+        ratio = np.divide(num, np.maximum(denom, tiny), dtype=np.float64)
+        circumradii_sq = np.where(degenerate, np.inf, ratio)
+
+    # `d` suffers from cancellation when the triangle is thin,
+    # and small triangles may underflow to subnormal numbers
+    inaccurate = np.abs(d) <= 0.1 * (np.abs(p) + np.abs(q))
+    inaccurate |= (denom < tiny) | (num < tiny)
+    inaccurate |= ~(np.isfinite(num) & np.isfinite(denom))
+
+    return circumradii_sq, inaccurate
@@ -1,21 +1,45 @@
+from typing import Optional
+
 import numpy as np
+import shapely
 from matplotlib.patches import PathPatch
 from matplotlib.path import Path
-from alpha_shapes.boundary import Boundary, get_boundaries
+from shapely import MultiPolygon, Polygon
 
 
 def plot_alpha_shape(ax, alpha_shape):
-    for boundary in get_boundaries(alpha_shape):
-        _plot_boundary(ax, boundary)
+    if not isinstance(alpha_shape, (Polygon, MultiPolygon)):
+        raise TypeError(
+            f"alpha_shape must be a Polygon or MultiPolygon, not {type(alpha_shape)}"
+        )
+
+    path = _shape_to_path(alpha_shape)
+    if path is None:
+        # nothing to plot for an empty shape
+        return
+
+    patch = PathPatch(path, facecolor="r", lw=0.8, alpha=0.5, ec="b")
+    ax.add_patch(patch)
 
 
-def _plot_boundary(ax, boundary: Boundary):
+def _shape_to_path(alpha_shape) -> Optional[Path]:
     """
-    Plot a boundary using matplotlib's PathPatch.
+    Build a single compound matplotlib Path from all the rings of a shape,
+    or return None if the shape is empty.
+    The coordinates of all rings are fetched with one call to shapely.
     see https://stackoverflow.com/a/70533052/6060982
     """
-    exterior = Path(boundary.exterior)
-    holes = [Path(hole) for hole in boundary.holes]
-    path = Path.make_compound_path(exterior, *holes)
-    patch = PathPatch(path, facecolor="r", lw=0.8, alpha=0.5, ec="b")
-    ax.add_patch(patch)
+    rings = shapely.get_rings(shapely.get_parts(alpha_shape))
+    vertices, ring_index = shapely.get_coordinates(rings, return_index=True)
+    if ring_index.size == 0:
+        return None
+
+    # the rings are closed, so the last vertex of each ring repeats the first one
+    starts = np.searchsorted(ring_index, np.arange(rings.size))
+    ends = np.append(starts[1:], ring_index.size) - 1
+
+    codes = np.full(ring_index.size, Path.LINETO, dtype=Path.code_type)
+    codes[starts] = Path.MOVETO
+    codes[ends] = Path.CLOSEPOLY
+
+    return Path(vertices, codes)
@@ -0,0 +1,77 @@
+"""
+Run all the examples headless, in parallel processes,
+and save their figures as PNG files.
+
+Usage: python examples/_render_all.py [output_dir]
+
+Each example runs in a fresh worker process with the Agg backend,
+so the examples do not share matplotlib's global state,
+the global random state, or the caches of alpha_shapes.
+The figures are saved to `output_dir`, by default `examples/rendered`.
+"""
+import os
+import runpy
+import sys
+import traceback
+import warnings
+from multiprocessing import Pool
+from pathlib import Path
+
+# set before matplotlib is imported by any of the workers
+os.environ["MPLBACKEND"] = "Agg"
+
+current_dir = Path(__file__).parent.absolute()
+
+
+def render(script: Path, output_dir: Path):
+    """
+    Run an example script and save all the figures it creates.
+    Return the paths of the saved figures.
+    """
+    import matplotlib.pyplot as plt
+
+    with warnings.catch_warnings():
+        # `plt.show()` is a no-op with the Agg backend
+        warnings.filterwarnings("ignore", message=".*non-interactive")
+        runpy.run_path(str(script), run_name="__main__")
+
+    saved = []
+    for num in plt.get_fignums():
+        path = output_dir / f"{script.stem}_{num}.png"
+        plt.figure(num).savefig(path)
+        saved.append(path)
+    plt.close("all")
+
+    return saved
+
+
+def main():
+    output_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else current_dir / "rendered"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    scripts = sorted(
+        script for script in current_dir.glob("*.py") if not script.name.startswith("_")
+    )
+
+    failed = []
+    # a worker exits after a single script, so each script gets a new process
+    with Pool(maxtasksperchild=1) as pool:
+        results = {
+            script: pool.apply_async(render, (script, output_dir)) for script in scripts
+        }
+        for script, result in results.items():
+            try:
+                saved = result.get()
+            except Exception:
+                failed.append(script.name)
+                print(f"{script.name}: failed")
+                traceback.print_exc()
+            else:
+                print(f"{script.name}: {len(saved)} figure(s)")
+
+    if failed:
+        sys.exit(f"failed examples: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
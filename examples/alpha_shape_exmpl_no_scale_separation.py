@@ -1,48 +1,52 @@
 import matplotlib.pyplot as plt
+import numpy as np
 
 from alpha_shapes import Alpha_Shaper, plot_alpha_shape
 
 #  Define a set of points
 
-points = [
-    (0.0, 0.0),
-    (0.0, 1.0),
-    (1.0, 1.1),
-    (1.0, 0.0),
-    (0.25, 0.15),
-    (0.65, 0.45),
-    (0.75, 0.75),
-    (0.5, 0.5),
-    (0.5, 0.25),
-    (0.5, 0.75),
-    (0.25, 0.5),
-    (0.75, 0.25),
-    (0.0, 2.0),
-    (0.0, 2.1),
-    (1.0, 2.1),
-    (0.5, 2.5),
-    (-0.5, 1.5),
-    (-0.25, 1.5),
-    (-0.25, 1.25),
-    (0, 1.25),
-    (1.5, 1.5),
-    (1.25, 1.5),
-    (1.25, 1.25),
-    (1, 1.25),
-    (0.5, 2.25),
-    (1.0, 2.0),
-    (0.25, 2.15),
-    (0.65, 2.45),
-    (0.75, 2.75),
-    (0.5, 2.5),
-    (0.5, 2.25),
-    (0.5, 2.75),
-    (0.25, 2.5),
-    (0.75, 2.25),
-]
+points = np.array(
+    [
+        (0.0, 0.0),
+        (0.0, 1.0),
+        (1.0, 1.1),
+        (1.0, 0.0),
+        (0.25, 0.15),
+        (0.65, 0.45),
+        (0.75, 0.75),
+        (0.5, 0.5),
+        (0.5, 0.25),
+        (0.5, 0.75),
+        (0.25, 0.5),
+        (0.75, 0.25),
+        (0.0, 2.0),
+        (0.0, 2.1),
+        (1.0, 2.1),
+        (0.5, 2.5),
+        (-0.5, 1.5),
+        (-0.25, 1.5),
+        (-0.25, 1.25),
+        (0, 1.25),
+        (1.5, 1.5),
+        (1.25, 1.5),
+        (1.25, 1.25),
+        (1, 1.25),
+        (0.5, 2.25),
+        (1.0, 2.0),
+        (0.25, 2.15),
+        (0.65, 2.45),
+        (0.75, 2.75),
+        (0.5, 2.5),
+        (0.5, 2.25),
+        (0.5, 2.75),
+        (0.25, 2.5),
+        (0.75, 2.25),
+    ],
+    dtype=np.float64,
+)
 
 
-points = list(set(points))
+points = np.unique(points, axis=0)
 
 #  Calculate the optimal alpha shape
 shaper = Alpha_Shaper(points, normalize=False)
@@ -52,9 +56,9 @@ print(alpha_opt)
 
 #  Visualize
 fig, (ax0, ax1) = plt.subplots(1, 2)
-ax0.scatter(*zip(*points))
+ax0.scatter(points[:, 0], points[:, 1])
 ax0.set_title("data")
-ax1.scatter(*zip(*points))
+ax1.scatter(points[:, 0], points[:, 1])
 
 
 plot_alpha_shape(ax1, shape)
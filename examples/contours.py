@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import cast
 
 import matplotlib.pyplot as plt
@@ -6,18 +7,19 @@ import numpy as np
 
 from alpha_shapes import Alpha_Shaper
 
-np.random.seed(42)  # for reproducibility
+current_dir = Path(__file__).parent.absolute()
 
 #  Define a set of points
-points = np.random.random((1000, 2))
+# (1000 random points shared by the demos, generated with
+# `np.random.seed(42); np.random.random((1000, 2))`)
+points = np.load(current_dir / "data" / "random_1000.npy")
 
 x = points[:, 0]
 y = points[:, 1]
 
 
-z = x**2 * np.cos(5 * x * y - 8 * x + 9 * y) + y**2 * np.sin(
-    5 * x * y - 8 * x + 9 * y
-)
+phase = 5 * x * y - 8 * x + 9 * y
+z = x**2 * np.cos(phase) + y**2 * np.sin(phase)
 
 # If the characteristic scale along each axis varies significantly,
 # it may make sense to turn on the `normalize` option.
@@ -31,7 +33,7 @@ ax = cast(Axes, ax)
 
 ax.tricontourf(shaper, z)
 ax.triplot(shaper)
-ax.plot(x, y, ".k", markersize=2)
+ax.plot(x, y, ".k", markersize=2, rasterized=True)
 ax.set_aspect("equal")
 
 plt.show()
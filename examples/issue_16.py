@@ -1,7 +1,11 @@
+from pathlib import Path
+
 import numpy as np
 import matplotlib.pyplot as plt
 
-points = np.genfromtxt('data/issue_16_points.txt', delimiter=',')
+current_dir = Path(__file__).parent.absolute()
+
+points = np.loadtxt(current_dir / "data" / "issue_16_points.txt", delimiter=",")
 
 from alpha_shapes import Alpha_Shaper, plot_alpha_shape
 
@@ -13,10 +17,11 @@ print(f"Alpha shape optimize value:{alpha_opt}")
 fig, (ax0, ax1, ax2) = plt.subplots(
     1, 3, sharey=True, sharex=True, constrained_layout=True
 )
-ax0.scatter(*zip(*points))
+x, y = points[:, 0], points[:, 1]  # views shared by all panels
+for ax in (ax0, ax1, ax2):
+    # draw the dense point cloud as one image in vector output
+    ax.scatter(x, y, rasterized=True)
 ax0.set_title("data")
-ax1.scatter(*zip(*points))
-ax2.scatter(*zip(*points))
 
 plot_alpha_shape(ax1, shape)
 
@@ -1,14 +1,22 @@
-from time import time
+from pathlib import Path
+from time import perf_counter as time
 
 import matplotlib.pyplot as plt
 import numpy as np
 
 from alpha_shapes import Alpha_Shaper, plot_alpha_shape
 
-np.random.seed(42)  # for reproducibility
+current_dir = Path(__file__).parent.absolute()
 
 #  Define a set of random points
-points = np.random.random((1000, 2))
+# (1000 random points shared by the demos, generated with
+# `np.random.seed(42); np.random.random((1000, 2))`)
+points = np.load(current_dir / "data" / "random_1000.npy")
+# Warm up on a small, separate shaper, so that one-time costs such as
+# loading compiled kernels are not attributed to the timed calls.
+# Warming up `alpha_shaper` itself would fill its caches instead.
+Alpha_Shaper(points[:20]).optimize()
+
 # Prepare the shaper
 alpha_shaper = Alpha_Shaper(points)
 
@@ -18,39 +26,43 @@ alpha_opt, alpha_shape = alpha_shaper.optimize()
 te = time()
 print(f"optimization took: {te-ts:.2} sec")
 
-fig, axs = plt.subplots(
-    1, 2, sharey=True, sharex=True, constrained_layout=True
-)
-
-for ax in axs:
-    ax.plot(*zip(*points), linestyle="", color="k", marker=".", markersize=1)
-
-    ax.set_aspect("equal")
-
-axs[0].set_title("data")
-
-plot_alpha_shape(axs[1], alpha_shape)
-axs[1].triplot(alpha_shaper)
-axs[1].set_title(r"$\alpha_{\mathrm{opt}}$")
-
-# Calculate the shape for greater than optimal alpha
+# Calculate the shape for greater than optimal alpha.
+# The shaper reuses the circumradii sorted during the optimization.
+ts = time()
 alpha_sub_opt = alpha_shaper.get_shape(alpha_opt * 1.5)
+te = time()
+print(f"shape at 1.5 alpha_opt took: {te-ts:.2} sec")
 print(alpha_opt)
 
-#  Compare the alpha shapes
-fig, axs = plt.subplots(1, 3, sharey=True, sharex=True)
-
-for ax in axs:
-    ax.plot(*zip(*points), linestyle="", color="k", marker=".", markersize=1)
+#  Compare the alpha shapes in a single figure
+fig, axs = plt.subplots(
+    2, 2, sharey=True, sharex=True, constrained_layout=True
+)
+ax_data, ax_tri, ax_opt, ax_sub_opt = axs.flat
+
+for ax in axs.flat:
+    ax.plot(
+        points[:, 0],
+        points[:, 1],
+        linestyle="",
+        color="k",
+        marker=".",
+        markersize=1,
+        rasterized=True,
+    )
 
     ax.set_aspect("equal")
 
-axs[0].set_title("data")
+ax_data.set_title("data")
+
+plot_alpha_shape(ax_tri, alpha_shape)
+ax_tri.triplot(alpha_shaper)
+ax_tri.set_title(r"$\alpha_{\mathrm{opt}}$ triangulation")
 
-plot_alpha_shape(axs[1], alpha_shape)
-axs[1].set_title(r"$\alpha_{\mathrm{opt}}$")
-plot_alpha_shape(axs[2], alpha_sub_opt)
-axs[2].set_title(r"$1.5\ \alpha_{\mathrm{opt}}$")
+plot_alpha_shape(ax_opt, alpha_shape)
+ax_opt.set_title(r"$\alpha_{\mathrm{opt}}$")
+plot_alpha_shape(ax_sub_opt, alpha_sub_opt)
+ax_sub_opt.set_title(r"$1.5\ \alpha_{\mathrm{opt}}$")
 
 
 plt.show()
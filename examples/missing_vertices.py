@@ -33,12 +33,12 @@ delaunay = Delaunay(df)
 
 plt.triplot(df.decimalLongitude, df.decimalLatitude, delaunay.simplices)
 
-missing_vertices = set(range(shaper.x.size)) - set(
-    np.ravel(shaper._sorted_simplices())
-)
+covered = np.zeros(shaper.x.size, dtype=bool)
+covered[np.ravel(shaper._sorted_simplices())] = True
+missing_vertices = ~covered
 
-missing_x = [shaper.x[i] for i in missing_vertices]
-missing_y = [shaper.y[i] for i in missing_vertices]
+missing_x = shaper.x[missing_vertices]
+missing_y = shaper.y[missing_vertices]
 
 plt.scatter(missing_x, missing_y, color="red")
 
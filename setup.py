@@ -1,4 +1,18 @@
-from setuptools import setup, find_packages
+from setuptools import Extension, setup, find_packages
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    # The compiled kernels are optional, fall back to the pure python package.
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [Extension("alpha_shapes._circumradius",
+                   ["alpha_shapes/_circumradius.pyx"],
+                   depends=["alpha_shapes/_circumradius_simd.h"],
+                   extra_compile_args=["-O3"],
+                   optional=True)],
+    )
 
 with open("README.md", "r") as fh:
     long_description = fh.read()
@@ -10,10 +24,12 @@ setup(name="alpha_shapes",
       author="Panagiotis Zestanakis",
       author_email="panosz@gmail.com",
       packages=find_packages(),
+      ext_modules=ext_modules,
       version='1.1.1',
       install_requires=['numpy',
-                        'shapely',
+                        'shapely>=2.0',
                         'matplotlib'],
+      extras_require={'numba': ['numba']},
       classifiers=[
           "Programming Language :: Python :: 3",
           "License :: OSI Approved :: MIT License",
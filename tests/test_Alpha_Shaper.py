@@ -6,16 +6,21 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 import pytest
+from matplotlib.tri import Triangulation
+from numpy.typing import NDArray
 
+import alpha_shapes.alpha_shapes as alpha_shapes_module
 from alpha_shapes import Alpha_Shaper
+from alpha_shapes.alpha_shapes import (
+    _circumradii_sq_from_coords,
+    _circumradii_sq_numpy,
+    _normalize_points,
+    _run_on_triangle_chunks,
+)
 
 
-def test_optimization_with_strongly_shaped_points():
-    """
-    Test the optimization with strongly shaped points
-    issue #1
-    """
-    points = [
+STRONGLY_SHAPED_POINTS = np.array(
+    [
         (363820.32, 5771887.69),
         (363837.36, 5771916.33),
         (363870.03, 5771951.57),
@@ -24,17 +29,78 @@ def test_optimization_with_strongly_shaped_points():
         (363821.03, 5771850.18),
         (363844.05, 5771928.69),
         (363828.75, 5771906.28),
-    ]
-    shaper = Alpha_Shaper(points)
+    ],
+    dtype=np.float64,
+)
+
+
+def test_optimization_with_strongly_shaped_points():
+    """
+    Test the optimization with strongly shaped points
+    issue #1
+    """
+    shaper = Alpha_Shaper(STRONGLY_SHAPED_POINTS)
     shaper.optimize()
 
     # check that no simplex is masked
+    assert shaper.mask is not None
     not_masked = np.logical_not(shaper.mask)
     assert np.all(not_masked)
 
 
-@pytest.fixture(scope="class")
-def dataset_issue_3() -> pd.DataFrame:
+@pytest.fixture(scope="session")
+def dataset_issue_16() -> NDArray:
+    """
+    returns the dataset referenced in issue #16
+    """
+    datafile = (
+        Path(__file__).parent.parent / "examples" / "data" / "issue_16_points.txt"
+    )
+    return np.loadtxt(datafile, delimiter=",")
+
+
+def test_optimization_with_small_triangles(dataset_issue_16):
+    """
+    Test the optimization with a dense dataset, whose normalized
+    triangles are small, but not degenerate
+    issue #16
+    """
+    alpha_opt, _ = Alpha_Shaper(dataset_issue_16).optimize()
+
+    assert alpha_opt == pytest.approx(73.368618, rel=1e-6)
+
+
+def test_shape_with_collinear_triangles(dataset_issue_16):
+    """
+    Test the shape at alpha 0 for a dataset, some of whose triangles
+    are collinear in the original coordinates, but not in the normalized ones
+    issue #16
+    """
+    shape = Alpha_Shaper(dataset_issue_16).get_shape(0)
+
+    assert shape.geom_type == "Polygon"
+    assert shape.area == pytest.approx(250623.0)
+
+
+def test_normalization_center():
+    """
+    Test that centering the normalized points on their bounding box
+    instead of their mean does not change the shape of generic points
+    """
+    rng = np.random.default_rng(3)
+    points = rng.random((300, 2)) * [100.0, 1.0] + [1e3, 5.0]
+    mean_centered = (points - points.mean(axis=0)) / np.ptp(points, axis=0)
+    triangulation = Triangulation(mean_centered[:, 0], mean_centered[:, 1])
+
+    shaper = Alpha_Shaper(points)
+    reference = Alpha_Shaper.from_triangulation(points, triangulation.triangles)
+
+    for alpha in [0, 1.0, 5.0, 20.0]:
+        assert shaper.get_shape(alpha).equals(reference.get_shape(alpha))
+
+
+@pytest.fixture(scope="session")
+def dataset_issue_3() -> NDArray:
     """
     returns the dataset referenced in issue #3
     A standard triangulation may not cover all vertices.
@@ -45,7 +111,7 @@ def dataset_issue_3() -> pd.DataFrame:
 
     df = pd.read_csv(datafile)
 
-    return df.drop_duplicates()   # type: ignore
+    return df.drop_duplicates().to_numpy(dtype=np.float64)
 
 
 class TestAlphaShaperIssue3:
@@ -70,3 +136,211 @@ class TestAlphaShaperIssue3:
         )
 
         assert len(all_uncovered_vertices) != 0
+
+
+def test_circumradii_of_known_triangles():
+    """
+    Test the batched circumradius calculation against known values
+    """
+    x = np.array([[0.0, 3.0, 0.0], [0.0, 1.0, 0.5], [0.0, 1.0, 2.0]])
+    y = np.array([[0.0, 0.0, 4.0], [0.0, 0.0, np.sqrt(3) / 2], [0.0, 0.0, 0.0]])
+
+    circumradii_sq = _circumradii_sq_from_coords(x, y)
+
+    np.testing.assert_allclose(circumradii_sq[:2], [6.25, 1 / 3])
+    assert np.isinf(circumradii_sq[2])
+
+
+def test_circumradius_of_thin_triangle():
+    """
+    Test that the circumradius of a nearly degenerate triangle is accurate
+    """
+    x = np.array([0.0, 1.0, 0.5])
+    y = np.array([0.0, 0.0, 1e-6])
+
+    circumradius_sq = _circumradii_sq_from_coords(x, y)
+
+    np.testing.assert_allclose(circumradius_sq, (0.25 + 1e-12) ** 2 / 4e-12)
+
+
+def test_circumradius_with_short_edge():
+    """
+    Test that the short edge of a triangle with two close vertices
+    does not lose accuracy
+    """
+    x = np.array([0.0, 1000.0, 1000.001])
+    y = np.array([0.0, 0.0, 1e-4])
+
+    circumradius_sq = _circumradii_sq_from_coords(x, y)
+
+    np.testing.assert_allclose(circumradius_sq, 25250050.500025503, rtol=1e-6)
+
+
+def test_circumradius_of_small_triangle():
+    """
+    Test that a small, but not degenerate, triangle has a finite circumradius
+    """
+    x = np.array([0.0, 3.0, 0.0]) * 1e-6
+    y = np.array([0.0, 0.0, 4.0]) * 1e-6
+
+    circumradius_sq = _circumradii_sq_from_coords(x, y)
+
+    np.testing.assert_allclose(circumradius_sq, 6.25e-12, rtol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "module", ["alpha_shapes._circumradius", "alpha_shapes._numba_kernels"]
+)
+def test_circumradius_kernels_agree(module):
+    """
+    Test that the optional compiled kernels agree with the numpy kernel,
+    also for degenerate triangles, in the vectorized part and the tail
+    """
+    kernel = pytest.importorskip(module).circumradii_sq
+
+    rng = np.random.default_rng(5)
+    tri_xy = rng.random((23, 3, 2)) + 1e3
+    edges = rng.random((2, 2))
+    tri_xy[1] = [[0.0, 0.0], edges[0], 2 * edges[0]]  # exactly collinear
+    tri_xy[21] = [[0.0, 0.0], edges[1], 2 * edges[1]]
+    tri_xy[6, 1] = tri_xy[6, 0]  # coincident vertices
+    tri_xy[10] = [[0.0, 0.0], [1.0, 0.0], [0.5, 1e-6]]  # thin
+    tri_xy[22] = [[0.0, 0.0], [1000.0, 0.0], [1000.001, 1e-4]]  # short edge
+
+    expected = np.empty(len(tri_xy))
+    _circumradii_sq_numpy(tri_xy, expected)
+    circumradii_sq = np.empty(len(tri_xy))
+    kernel(tri_xy, circumradii_sq)
+
+    assert np.all(np.isinf(expected[[1, 6, 21]]))
+    np.testing.assert_allclose(circumradii_sq, expected, rtol=1e-5)
+
+
+def test_normalize_points_kernels_agree(monkeypatch, dataset_issue_16):
+    """
+    Test that the optional numba kernel normalizes the points
+    bit for bit like numpy, so that the triangulation does not depend on it
+    """
+    kernel = pytest.importorskip("alpha_shapes._numba_kernels").normalize_points
+    monkeypatch.setattr(alpha_shapes_module, "_normalize_points_numba", None)
+
+    # the kernel also takes points that are not C-contiguous
+    for points in [dataset_issue_16, np.asfortranarray(dataset_issue_16[::-3])]:
+        expected = _normalize_points(points)
+        normalized = kernel(points)
+
+        for result, reference in zip(normalized, expected):
+            np.testing.assert_array_equal(result, reference)
+
+
+def test_circumradius_in_parallel_chunks(monkeypatch):
+    """
+    Test that the circumradii calculated on chunks of the triangles
+    in parallel threads match the ones calculated in a single call
+    """
+    monkeypatch.setattr(alpha_shapes_module, "PARALLEL_MIN_TRIANGLES", 10)
+    monkeypatch.setattr(alpha_shapes_module.os, "cpu_count", lambda: 4)
+
+    rng = np.random.default_rng(7)
+    tri_xy = rng.random((103, 3, 2))
+    tri_xy[50, 1] = tri_xy[50, 0]  # degenerate
+
+    expected = np.empty(len(tri_xy))
+    _circumradii_sq_numpy(tri_xy, expected)
+
+    chunk_sizes = []
+
+    def kernel(tri_xy, out):
+        chunk_sizes.append(len(tri_xy))
+        _circumradii_sq_numpy(tri_xy, out)
+
+    circumradii_sq = np.empty(len(tri_xy))
+    _run_on_triangle_chunks(kernel, tri_xy, circumradii_sq)
+
+    assert len(chunk_sizes) == 4
+    assert sum(chunk_sizes) == len(tri_xy)
+    np.testing.assert_array_equal(circumradii_sq, expected)
+
+
+def test_set_mask_at_alpha(monkeypatch):
+    """
+    Test that the mask is written into the same array on every call,
+    and that it is not set again at the same alpha value
+    """
+    rng = np.random.default_rng(42)
+    shaper = Alpha_Shaper(rng.random((200, 2)))
+
+    mask = shaper.set_mask_at_alpha(5.0).mask
+    assert mask is not None
+    kept = mask.copy()
+    np.testing.assert_array_equal(kept, shaper.get_mask(5.0))
+
+    shaper.set_mask_at_alpha(20.0)
+    assert shaper.mask is mask
+    np.testing.assert_array_equal(mask, shaper.get_mask(20.0))
+    assert np.count_nonzero(mask) > np.count_nonzero(kept)
+
+    # a mask set from outside is replaced at the same alpha value
+    shaper.set_mask(None)
+    shaper.set_mask_at_alpha(20.0)
+    assert shaper.mask is mask
+
+    def fail(mask):
+        raise AssertionError("the mask is set again")
+
+    monkeypatch.setattr(shaper, "set_mask", fail)
+    assert shaper.set_mask_at_alpha(20.0) is shaper
+
+
+def test_sweep_alphas():
+    """
+    Test that a sweep over alpha values matches the individual shapes
+    """
+    rng = np.random.default_rng(42)
+    shaper = Alpha_Shaper(rng.random((200, 2)))
+    alphas = [0, 2.0, 5.0, 10.0]
+
+    shapes = shaper.sweep_alphas(alphas)
+
+    for alpha, shape in zip(alphas, shapes):
+        assert shape.equals(shaper.get_shape(alpha))
+
+    areas = [shape.area for shape in shapes]
+    assert areas == sorted(areas, reverse=True)
+
+
+def test_from_points_reuses_triangulation():
+    """
+    Test that repeated construction from the same points
+    reuses the triangulation and gives the same result
+    """
+    rng = np.random.default_rng(7)
+    points = rng.random((200, 2))
+
+    first = Alpha_Shaper.from_points(points)
+    second = Alpha_Shaper.from_points(points)
+
+    assert not second.is_delaunay  # the triangles were passed in
+    np.testing.assert_array_equal(first.triangles, second.triangles)
+    assert first.optimize()[0] == second.optimize()[0]
+
+
+def test_from_triangulation():
+    """
+    Test that an alpha shaper built from precomputed simplices,
+    in either orientation, matches the one that triangulates the points
+    """
+    rng = np.random.default_rng(11)
+    points = rng.random((300, 2))
+    shaper = Alpha_Shaper(points, normalize=False)
+
+    for simplices in (shaper.simplices, shaper.simplices[:, ::-1]):
+        other = Alpha_Shaper.from_triangulation(points, simplices, normalize=False)
+
+        np.testing.assert_allclose(
+            other.circumradii_sq, shaper.circumradii_sq, rtol=1e-5
+        )
+        alpha_opt, shape = shaper.optimize()
+        other_alpha_opt, other_shape = other.optimize()
+        assert other_alpha_opt == pytest.approx(alpha_opt, rel=1e-5)
+        assert other_shape.equals(shape)
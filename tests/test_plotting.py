@@ -0,0 +1,50 @@
+"""
+tests for plotting.py
+"""
+import numpy as np
+import pytest
+import shapely
+from matplotlib.figure import Figure
+from matplotlib.path import Path
+from shapely import MultiPolygon, Polygon, box
+
+from alpha_shapes import plot_alpha_shape
+
+
+@pytest.fixture
+def ax():
+    return Figure().add_subplot()
+
+
+@pytest.mark.parametrize("shape", [Polygon(), MultiPolygon()])
+def test_plot_empty_shape(ax, shape):
+    """
+    Test that an empty shape is plotted without adding a patch
+    """
+    plot_alpha_shape(ax, shape)
+
+    assert len(ax.patches) == 0
+
+
+def test_plot_shape_with_hole(ax):
+    """
+    Test that all rings of all parts end up in a single compound path
+    """
+    with_hole = Polygon(
+        [(0, 0), (4, 0), (4, 4), (0, 4)], [[(1, 1), (1, 3), (3, 3), (3, 1)]]
+    )
+    shape = MultiPolygon([with_hole, box(5, 0, 6, 1)])
+
+    plot_alpha_shape(ax, shape)
+
+    (patch,) = ax.patches
+    path = patch.get_path()
+    np.testing.assert_array_equal(path.vertices, shapely.get_coordinates(shape))
+    assert np.count_nonzero(path.codes == Path.MOVETO) == 3
+    assert np.count_nonzero(path.codes == Path.CLOSEPOLY) == 3
+    assert len(path.to_polygons(closed_only=True)) == 3
+
+
+def test_plot_rejects_other_geometries(ax):
+    with pytest.raises(TypeError):
+        plot_alpha_shape(ax, box(0, 0, 1, 1).exterior)